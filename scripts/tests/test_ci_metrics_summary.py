@@ -0,0 +1,204 @@
+"""
+Unit tests for ci_metrics_summary.py report loaders.
+
+Tests cover:
+- JaCoCo line-coverage extraction
+- PITest mutation counting
+- Surefire aggregation across report files
+- SpotBugs bug-instance counting
+- Dependency-Check severity bucketing
+- Missing/malformed report handling
+"""
+
+import json
+
+import pytest
+
+from scripts import ci_metrics_summary as cms
+
+
+JACOCO_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<report name="demo">
+  <counter type="INSTRUCTION" missed="10" covered="90"/>
+  <counter type="LINE" missed="5" covered="45"/>
+</report>
+"""
+
+PITEST_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<mutations>
+  <mutation detected="true" status="KILLED"><sourceFile>A.java</sourceFile></mutation>
+  <mutation detected="true" status="KILLED"><sourceFile>A.java</sourceFile></mutation>
+  <mutation detected="false" status="SURVIVED"><sourceFile>B.java</sourceFile></mutation>
+  <mutation detected="false" status="NO_COVERAGE"><sourceFile>B.java</sourceFile></mutation>
+</mutations>
+"""
+
+SUREFIRE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="demo.SuiteTest" tests="12" failures="1" errors="0" skipped="2" time="3.5">
+  <testcase name="ok" classname="demo.SuiteTest" time="0.1"/>
+</testsuite>
+"""
+
+SPOTBUGS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<BugCollection>
+  <BugInstance type="NP_NULL_ON_SOME_PATH"/>
+  <BugInstance type="EI_EXPOSE_REP"/>
+  <BugInstance type="EI_EXPOSE_REP2"/>
+</BugCollection>
+"""
+
+
+@pytest.fixture
+def target_dir(tmp_path, monkeypatch):
+    """Point the module's TARGET at a temp Maven target/ folder."""
+    target = tmp_path / "target"
+    target.mkdir()
+    monkeypatch.setattr(cms, "TARGET", target)
+    return target
+
+
+class TestLoadJacoco:
+    """Tests for JaCoCo coverage extraction."""
+
+    def test_parses_line_counter(self, target_dir):
+        """LINE counter is picked out and percentages computed."""
+        report = target_dir / "site" / "jacoco" / "jacoco.xml"
+        report.parent.mkdir(parents=True)
+        report.write_text(JACOCO_XML)
+        result = cms.load_jacoco()
+        assert result == {"covered": 45, "missed": 5, "total": 50, "pct": 90.0}
+
+    def test_missing_report_returns_none(self, target_dir):
+        """Absent report means the gate was skipped, not an error."""
+        assert cms.load_jacoco() is None
+
+    def test_malformed_xml_returns_none(self, target_dir):
+        """Broken XML is treated like a missing report."""
+        report = target_dir / "site" / "jacoco" / "jacoco.xml"
+        report.parent.mkdir(parents=True)
+        report.write_text("<report><counter")
+        assert cms.load_jacoco() is None
+
+
+class TestLoadPitest:
+    """Tests for PITest mutation counting."""
+
+    def test_counts_statuses(self, target_dir):
+        """Killed/survived/detected tallies and kill percentage."""
+        report = target_dir / "pit-reports" / "mutations.xml"
+        report.parent.mkdir(parents=True)
+        report.write_text(PITEST_XML)
+        result = cms.load_pitest()
+        assert result == {"total": 4, "killed": 2, "survived": 1, "detected": 2, "pct": 50.0}
+
+    def test_empty_report(self, target_dir):
+        """Zero mutations yields zeroed metrics, not a crash."""
+        report = target_dir / "pit-reports" / "mutations.xml"
+        report.parent.mkdir(parents=True)
+        report.write_text("<mutations></mutations>")
+        result = cms.load_pitest()
+        assert result == {"total": 0, "killed": 0, "survived": 0, "detected": 0, "pct": 0.0}
+
+
+class TestLoadSurefire:
+    """Tests for Surefire result aggregation."""
+
+    def test_aggregates_multiple_files(self, target_dir):
+        """Counts and runtimes sum across TEST-*.xml files."""
+        report_dir = target_dir / "surefire-reports"
+        report_dir.mkdir()
+        (report_dir / "TEST-demo.OneTest.xml").write_text(SUREFIRE_XML)
+        (report_dir / "TEST-demo.TwoTest.xml").write_text(SUREFIRE_XML)
+        result = cms.load_surefire()
+        assert result == {"tests": 24, "failures": 2, "errors": 0, "skipped": 4, "time": 7.0}
+
+    def test_skips_malformed_file(self, target_dir):
+        """One bad file does not poison the aggregate."""
+        report_dir = target_dir / "surefire-reports"
+        report_dir.mkdir()
+        (report_dir / "TEST-demo.OneTest.xml").write_text(SUREFIRE_XML)
+        (report_dir / "TEST-demo.BadTest.xml").write_text("<testsuite")
+        result = cms.load_surefire()
+        assert result["tests"] == 12
+
+    def test_missing_dir_returns_none(self, target_dir):
+        """No surefire-reports directory means no data."""
+        assert cms.load_surefire() is None
+
+
+class TestLoadSpotbugs:
+    """Tests for SpotBugs bug counting."""
+
+    def test_counts_bug_instances(self, target_dir):
+        """Every BugInstance element is counted."""
+        (target_dir / "spotbugsXml.xml").write_text(SPOTBUGS_XML)
+        assert cms.load_spotbugs_count() == 3
+
+    def test_missing_report_returns_none(self, target_dir):
+        """Absent report returns None (badge shows n/a)."""
+        assert cms.load_spotbugs_count() is None
+
+
+class TestLoadDependencyCheck:
+    """Tests for Dependency-Check severity bucketing."""
+
+    def test_counts_severities(self, target_dir):
+        """Vulnerabilities are bucketed by normalized severity."""
+        report = target_dir / "dependency-check-report.json"
+        report.write_text(json.dumps({
+            "dependencies": [
+                {"fileName": "a.jar", "vulnerabilities": [
+                    {"name": "CVE-1", "severity": "HIGH"},
+                    {"name": "CVE-2", "severity": "critical"},
+                ]},
+                {"fileName": "b.jar"},
+                {"fileName": "c.jar", "vulnerabilities": [
+                    {"name": "CVE-3", "severity": "BOGUS"},
+                ]},
+            ],
+        }))
+        result = cms.load_dependency_check()
+        assert result["dependencies"] == 3
+        assert result["vulnerable_dependencies"] == 2
+        assert result["vulnerabilities"] == 3
+        assert result["severity"] == {
+            "CRITICAL": 1, "HIGH": 1, "MEDIUM": 0, "LOW": 0, "UNKNOWN": 1,
+        }
+
+    def test_malformed_json_returns_none(self, target_dir):
+        """Broken JSON is treated like a missing report."""
+        report = target_dir / "dependency-check-report.json"
+        report.write_text("{not json")
+        assert cms.load_dependency_check() is None
+
+
+class TestAssembleMetrics:
+    """Tests for the dashboard metrics assembly."""
+
+    def test_all_reports_missing(self):
+        """Missing reports yield zeroed metrics and INFO console lines."""
+        metrics = cms._assemble_metrics(None, None, None, None)
+        assert metrics["tests"]["total"] == 0
+        assert metrics["coverage"]["percent"] == 0.0
+        assert metrics["mutation"]["total"] == 0
+        assert metrics["dependencyCheck"]["scanned"] == 0
+        assert any("0 vulnerable dependencies" in line for line in metrics["console"])
+
+    def test_vulnerable_deps_warn_line(self):
+        """Vulnerable dependencies produce a WARN console line."""
+        dep = {
+            "dependencies": 10,
+            "vulnerable_dependencies": 2,
+            "vulnerabilities": 3,
+            "severity": {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 0, "LOW": 0, "UNKNOWN": 0},
+        }
+        metrics = cms._assemble_metrics(None, None, None, dep)
+        assert metrics["dependencyCheck"]["vulnerableDeps"] == 2
+        assert metrics["dependencyCheck"]["vulnerabilities"]["critical"] == 1
+        assert any(line.startswith("[WARN] Dependency-Check: 2") for line in metrics["console"])
+
+    def test_mutation_no_coverage_derived(self):
+        """noCoverage is the remainder after killed and survived."""
+        pit = {"total": 10, "killed": 6, "survived": 1, "detected": 6, "pct": 60.0}
+        metrics = cms._assemble_metrics(None, None, pit, None)
+        assert metrics["mutation"]["noCoverage"] == 3